@@ -6,15 +6,35 @@ Outputs JSON to stdout for easy parsing by agents.
 """
 
 import argparse
+import configparser
 import json
 import os
+import random
 import re
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager, suppress
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from urllib.parse import quote
 
-from github import Auth, Github, GithubException
+from github import Auth, Github, GithubException, GithubRetry
+
+try:
+    # Optional: faster JSON encoding for large feedback payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+UTC = timezone.utc
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
 
 # Constants for Review Bots
 REVIEW_COMMANDS = [
@@ -32,6 +52,17 @@ GIT_PUSH_TIMEOUT = 60
 GH_AUTH_TIMEOUT = 10
 GH_REPO_VIEW_TIMEOUT = 30
 
+# GitHub client tuning
+GITHUB_PER_PAGE = 100  # API maximum; default of 30 triples pagination round-trips
+GITHUB_POOL_SIZE = 10  # Keep-alive connections shared by concurrent fetches
+GITHUB_RETRY_TOTAL = 5
+GITHUB_RETRY_BACKOFF = 0.5
+# Transient statuses worth retrying (GithubRetry adds rate-limited 403s itself)
+GITHUB_RETRY_STATUSES = [429, 500, 502, 503, 504]
+# Idempotent methods only: a retried POST (e.g. the addComment mutation) could
+# post duplicate trigger comments if the first attempt actually went through
+GITHUB_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
 # Polling constants for review feedback
 # Configurable via environment variables
 try:
@@ -46,6 +77,39 @@ try:
 except ValueError:
     POLL_MAX_ATTEMPTS = 20
 
+# Wall-clock bound on the reviewer poll (the attempt count alone would stretch
+# as idle polls back off)
+try:
+    POLL_TIMEOUT_SECONDS = max(
+        int(os.environ.get("PR_REVIEW_POLL_TIMEOUT", "600")), 1)
+except ValueError:
+    POLL_TIMEOUT_SECONDS = 600
+
+# Idle polls back off exponentially, starting at half the poll interval, up to this cap
+try:
+    POLL_MAX_INTERVAL_SECONDS = max(
+        int(os.environ.get("PR_REVIEW_POLL_MAX_INTERVAL", "120")),
+        POLL_INTERVAL_SECONDS)
+except ValueError:
+    POLL_MAX_INTERVAL_SECONDS = max(120, POLL_INTERVAL_SECONDS)
+
+# Poll errors worth backing off on (rate limits and transient server errors);
+# a 403 only counts when it is a rate limit (see _is_retryable)
+RETRYABLE_STATUSES = (403, 429, 500, 502, 503, 504)
+POLL_ERROR_MAX_DELAY_SECONDS = 900
+POLL_ERROR_JITTER_SECONDS = 5
+# Relative jitter applied to the idle backoff between polls
+POLL_JITTER_FRACTION = 0.2
+
+# Suggested wait between agent-run 'status' checks while nothing arrives:
+# doubles per consecutive empty result (tracked per PR in the cache dir)
+STATUS_WAIT_BASE_SECONDS = 15
+STATUS_WAIT_MAX_SECONDS = 300
+POLL_STATE_FILENAME = "poll_state.json"
+
+# Step between probes while waiting for the first bot response after a trigger
+INITIAL_WAIT_STEP_SECONDS = 5
+
 # Default Validation Reviewer (The bot/user that must approve)
 DEFAULT_VALIDATION_REVIEWER = os.environ.get("PR_REVIEW_VALIDATION_REVIEWER",
                                              "gemini-code-assist[bot]")
@@ -61,10 +125,172 @@ ACTION_INSTRUCTIONS = (
 
 RATE_LIMIT_INSTRUCTION = " If main reviewer says it just became rate-limited, address remaining code reviews then stop there."
 
+# Suffix shared by the next_step messages that ask for fixes from the main reviewer
+ACTION_AND_RATE_LIMIT_INSTRUCTIONS = ACTION_INSTRUCTIONS + RATE_LIMIT_INSTRUCTION
+
+# Lightweight poll probe: the latest reviews and comments with their authors
+# and timestamps only (no bodies), in a single GraphQL request
+REVIEWER_ACTIVITY_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      reviews(last: 20) { nodes { author { __typename login } submittedAt } }
+      comments(last: 50) { nodes { author { __typename login } updatedAt } }
+      reviewThreads(last: 20) {
+        nodes {
+          comments(last: 5) { nodes { author { __typename login } updatedAt } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Extracts owner/repo from a GitHub remote URL
+# Matches: https://github.com/owner/repo.git, git@github.com:owner/repo.git, etc.
+REMOTE_URL_RE = re.compile(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$")
+
+# Matches the rel="next" URL of a GitHub Link pagination header
+LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+LINK_LAST_RE = re.compile(r'<([^>]+)>;\s*rel="last"')
+PAGE_PARAM_RE = re.compile(r"([?&]page=)(\d+)")
+
+# Upper bound on concurrent page requests for one paginated list
+PAGE_FETCH_WORKERS = 4
+
+# Cache files live in this directory inside the git dir (outside the worktree,
+# so writing them never makes the tree dirty for the clean-state checks), or
+# under the user cache dir when there is no repository
+CACHE_DIRNAME = "pr_skill"
+
+# Per-PR conditional request cache (ETag + payload), stored under the cache dir
+PR_CACHE_DIRNAME = "pr"
+
+# Working directory -> owner/name, for repos only resolvable via git/gh subprocesses
+REPO_CACHE_FILENAME = ".repo_cache.json"
+
+# Conditional request cache for remote branch refs (skips redundant git fetches)
+REF_CACHE_FILENAME = ".ref_cache.json"
+
+# End of the last rate-limit window reported by GitHub (shared across runs)
+RATE_LIMIT_FILENAME = ".rate_limit.json"
+
+# Feedback sources fetched by check_status, in output order.
+#   path:       endpoint below the repository URL
+#   since:      whether the endpoint filters by updated_at server-side
+#   time_field: raw timestamp an item must be at or after 'since' to be new
+#   fields:     (output key, raw key) pairs projected into each item
+FEEDBACK_SOURCES = (
+    {
+        "type": "issue_comment",
+        "path": "issues/{pr_number}/comments",
+        "since": True,
+        "time_field": "updated_at",
+        "fields": (("user", "user"), ("body", "body"), ("url", "html_url"),
+                   ("updated_at", "updated_at"), ("created_at",
+                                                  "created_at")),
+    },
+    {
+        "type": "inline_comment",
+        "path": "pulls/{pr_number}/comments",
+        "since": True,
+        "time_field": "updated_at",
+        "fields": (("user", "user"), ("body", "body"), ("path", "path"),
+                   ("line", "line"), ("created_at", "created_at"),
+                   ("updated_at", "updated_at"), ("url", "html_url")),
+    },
+    {
+        "type": "review_summary",
+        "path": "pulls/{pr_number}/reviews",
+        "since": False,
+        "time_field": "submitted_at",
+        "fields": (("user", "user"), ("state", "state"), ("body", "body"),
+                   ("created_at", "submitted_at")),
+    },
+)
+
+# Feedback item types that are plain comments (as opposed to review summaries)
+COMMENT_ITEM_TYPES = frozenset({"issue_comment", "inline_comment"})
+
+
+def _orjson_dumps(data, option=0):
+    """
+    Encodes with orjson when available. Returns: bytes, or None when orjson is
+    missing or rejects the data (lone surrogates in comment bodies, which the
+    stdlib encoder escapes instead).
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(data, option=option)
+    except TypeError:
+        return None
+
+
+def _json_bytes(data):
+    """Compact JSON encoding for cache files (orjson when available)."""
+    encoded = _orjson_dumps(data)
+    if encoded is None:
+        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return encoded
+
 
 def print_json(data):
-    """Helper to print JSON to stdout."""
-    print(json.dumps(data, indent=2))
+    """
+    Helper to print JSON to stdout. Indented on an interactive terminal,
+    compact otherwise (agents read it through a pipe, and large 'items'
+    lists shrink by roughly half without the indentation).
+    """
+    indent = sys.stdout.isatty()
+    if orjson is not None:
+        encoded = _orjson_dumps(data, orjson.OPT_INDENT_2 if indent else 0)
+        if encoded is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(encoded + b"\n")
+            sys.stdout.buffer.flush()
+            return
+    # json.dump streams encoder chunks instead of building one large string
+    if indent:
+        json.dump(data, sys.stdout, indent=2)
+    else:
+        json.dump(data, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
+def print_ndjson(data, stream_key="items"):
+    """
+    Prints a result as newline-delimited JSON: one line with the keys before
+    data[stream_key], one line per entry of that list, then one line with the
+    remaining keys. Consumers can handle entries as they arrive.
+    """
+    keys = list(data)
+    split = keys.index(stream_key)
+    lines = [{key: data[key] for key in keys[:split]}]
+    lines.extend(data[stream_key])
+    lines.append({key: data[key] for key in keys[split + 1:]})
+    write = sys.stdout.write
+    for line in lines:
+        encoded = _orjson_dumps(line)
+        if encoded is not None:
+            write(encoded.decode("utf-8"))
+        else:
+            write(json.dumps(line, separators=(",", ":")))
+        write("\n")
+    sys.stdout.flush()
+
+
+@contextmanager
+def _stop_on_sigterm(stop_event):
+    """
+    While active, SIGTERM (termination by a supervising agent/harness) sets
+    stop_event instead of killing the process, so a wait can end early and
+    still report status. The previous handler is restored on exit.
+    """
+    previous = signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
 
 
 def print_error(message, code=1):
@@ -73,109 +299,355 @@ def print_error(message, code=1):
     sys.exit(code)
 
 
+def _get_aware_utc_datetime(dt_obj):
+    """Converts a naive datetime (assumed UTC) into a timezone-aware UTC one."""
+    if dt_obj is None or dt_obj.tzinfo is UTC:
+        return dt_obj
+    if dt_obj.tzinfo is None:
+        return dt_obj.replace(tzinfo=UTC)
+    return dt_obj.astimezone(UTC)
+
+
+@lru_cache(maxsize=4096)
+def _parse_api_datetime(value):
+    """
+    Parses an API or ISO timestamp (e.g. '2024-01-01T12:00:00Z') into an aware UTC datetime.
+    Cached: the same timestamps recur across fields (created/updated) and polls,
+    and datetimes are immutable.
+    """
+    if not value:
+        return None
+    # Handle Z suffix for Python < 3.11 compatibility
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return _get_aware_utc_datetime(datetime.fromisoformat(value))
+
+
+def _load_json_cache(path):
+    """Loads a JSON object cache file. Returns {} when missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return {}
+    cache = None
+    if orjson is not None:
+        try:
+            cache = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # e.g. escaped lone surrogates written by the stdlib fallback
+            pass
+    if cache is None:
+        try:
+            cache = json.loads(raw)
+        except ValueError:
+            return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _read_gh_hosts_token():
+    """
+    Reads the github.com token from gh's hosts.yml without spawning 'gh'.
+    Returns None if the file is missing or the token lives in the system keyring.
+    """
+    config_dir = os.environ.get("GH_CONFIG_DIR") or os.path.join(
+        os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config"),
+        "gh")
+    try:
+        with open(os.path.join(config_dir, "hosts.yml"),
+                  encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    # Minimal YAML walk: find the top-level "github.com:" block and read its
+    # direct "oauth_token" child (avoids a PyYAML dependency).
+    in_host = False
+    child_indent = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        indent = len(line) - len(line.lstrip())
+        if indent == 0:
+            in_host = stripped.rstrip(":").strip("\"'") == "github.com"
+            child_indent = None
+            continue
+        if in_host:
+            if child_indent is None:
+                child_indent = indent
+            if indent == child_indent:
+                key, _, value = stripped.partition(":")
+                if key == "oauth_token" and value.strip():
+                    return value.strip().strip("\"'")
+    return None
+
+
+def _read_origin_url():
+    """
+    Reads remote.origin.url straight from .git/config without spawning 'git'.
+    Returns None when the config can't be resolved in-process (e.g. worktrees).
+    """
+    if os.environ.get("GIT_DIR"):
+        return None
+    path = os.getcwd()
+    while True:
+        git_dir = os.path.join(path, ".git")
+        if os.path.isdir(git_dir):
+            break
+        if os.path.exists(git_dir):
+            # Worktrees and submodules use a ".git" file pointing elsewhere
+            return None
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+    config = configparser.ConfigParser(strict=False,
+                                       interpolation=None,
+                                       allow_no_value=True)
+    try:
+        config.read(os.path.join(git_dir, "config"), encoding="utf-8")
+        return config.get('remote "origin"', "url", fallback=None)
+    except configparser.Error:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _git_path():
+    """
+    Absolute path of the git binary ($GIT_BIN overrides), resolved once per process.
+    Falls back to the bare name so a missing git still raises FileNotFoundError.
+    """
+    return os.environ.get("GIT_BIN") or shutil.which("git") or "git"
+
+
+@lru_cache(maxsize=1)
+def _gh_path():
+    """Absolute path of the gh CLI ($GH_BIN overrides), resolved once per process."""
+    return os.environ.get("GH_BIN") or shutil.which("gh") or "gh"
+
+
+@lru_cache(maxsize=1)
+def _resolve_token():
+    """
+    Resolves the GitHub token once per process, cheapest source first.
+    The token is not persisted anywhere: a keyring-backed gh token stays in the keyring.
+    """
+    token = (os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+             or _read_gh_hosts_token())
+    if not token:
+        # Fallback to gh CLI for auth token (e.g. stored in the system keyring)
+        try:
+            res = subprocess.run(
+                [_gh_path(), "auth", "token"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=GH_AUTH_TIMEOUT,
+            )
+            token = res.stdout.strip()
+        except (
+                subprocess.CalledProcessError,
+                FileNotFoundError,
+                subprocess.TimeoutExpired,
+        ) as e:
+            print_error(f"No GITHUB_TOKEN found and 'gh' command failed: {e}")
+    return token
+
+
+@lru_cache(maxsize=None)
+def _get_github_client(token):
+    """One shared client (and connection pool) per token for the whole process."""
+    return Github(
+        auth=Auth.Token(token),
+        per_page=GITHUB_PER_PAGE,
+        pool_size=GITHUB_POOL_SIZE,
+        # Don't fetch objects (repo, PR) until an attribute needs it
+        lazy=True,
+        # GithubRetry also honours Retry-After / rate-limit reset on 403s
+        retry=GithubRetry(total=GITHUB_RETRY_TOTAL,
+                          backoff_factor=GITHUB_RETRY_BACKOFF,
+                          status_forcelist=GITHUB_RETRY_STATUSES,
+                          allowed_methods=GITHUB_RETRY_METHODS,
+                          respect_retry_after_header=True),
+    )
+
+
 class ReviewManager:
 
     def __init__(self):
-        # Authenticate with GitHub
-        self.token = os.environ.get("GITHUB_TOKEN") or os.environ.get(
-            "GH_TOKEN")
-        if not self.token:
-            # Fallback to gh CLI for auth token if env var is missing
-            try:
-                res = subprocess.run(
-                    ["gh", "auth", "token"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=GH_AUTH_TIMEOUT,
-                )
-                self.token = res.stdout.strip()
-            except (
-                    subprocess.CalledProcessError,
-                    FileNotFoundError,
-                    subprocess.TimeoutExpired,
-            ) as e:
-                print_error(
-                    f"No GITHUB_TOKEN found and 'gh' command failed: {e}")
+        # Last seen PR ETags, used for cheap conditional change probes
+        self._pr_etags = {}
+        # Set (e.g. on SIGTERM) to cut short any wait between polls
+        self._stop_event = threading.Event()
 
+        # GitHub auth and repo lookup are deferred to first use (see token/g/repo)
+        # so local-only commands like safe_push never touch the API.
         try:
-            self.g = Github(auth=Auth.Token(self.token))
-            self.repo = self._detect_repo()
             self._ensure_workspace()
+        except OSError as e:
+            print_error(f"Initialization failed: {e}")
+
+    @cached_property
+    def token(self):
+        """GitHub token from the environment, gh's hosts.yml, or `gh auth token`."""
+        return _resolve_token()
+
+    @cached_property
+    def g(self):
+        """Authenticated GitHub client, created on first API use."""
+        try:
+            return _get_github_client(self.token)
+        except (GithubException, ValueError) as e:
+            print_error(f"Initialization failed: {self._mask_token(str(e))}")
+
+    @cached_property
+    def repo(self):
+        """Current repository, detected on first API use."""
+        try:
+            return self._detect_repo()
         except (GithubException, OSError, ValueError) as e:
-            # Mask token if present in error
-            safe_msg = str(e)
-            if self.token:
-                safe_msg = safe_msg.replace(self.token, "********")
-            print_error(f"Initialization failed: {safe_msg}")
+            print_error(f"Initialization failed: {self._mask_token(str(e))}")
 
     def _mask_token(self, text):
         """Redacts the GitHub token from the given text."""
-        if not self.token or not text:
+        # Only a token that was actually resolved can leak; don't resolve one here
+        token = self.__dict__.get("token")
+        if not token or not text:
             return text
-        return text.replace(self.token, "********")
+        return text.replace(token, "********")
+
+    def _interruptible_sleep(self, seconds):
+        """
+        Sleeps for the given time in a single wait (no wake-up chunks).
+        Raises KeyboardInterrupt when the stop event is set, so waits end through
+        the same path as Ctrl+C and still report a resumable status.
+        """
+        if self._stop_event.wait(seconds):
+            raise KeyboardInterrupt
 
     def _log(self, message):
         """Audit logging to stderr with timestamp."""
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = datetime.now(UTC).isoformat()
         # Tag logs as [AUDIT] for compliance and easier filtering
         print(f"[{timestamp}] [AUDIT] {message}", file=sys.stderr)
 
     def _ensure_workspace(self):
-        """Creates agent-workspace directory relative to repo root if possible."""
+        """
+        Creates agent-workspace directory relative to repo root if possible,
+        and the cache directory inside the git dir (user cache dir otherwise).
+        """
+        self.cache_dir = os.path.join(
+            os.environ.get("XDG_CACHE_HOME")
+            or os.path.expanduser("~/.cache"), CACHE_DIRNAME)
         try:
-            # Try to find repo root
-            root = subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
+            # Try to find repo root (and git dir, in the same process)
+            root, git_dir = subprocess.run(
+                [
+                    _git_path(), "rev-parse", "--show-toplevel",
+                    "--absolute-git-dir"
+                ],
                 capture_output=True,
                 text=True,
                 check=True,
-            ).stdout.strip()
+                timeout=GIT_SHORT_TIMEOUT,
+            ).stdout.splitlines()[:2]
+            self.cache_dir = os.path.join(git_dir, CACHE_DIRNAME)
             if os.path.basename(root) == "agent-tools":
                 self.workspace = os.path.join(root, "agent-workspace")
             else:
                 self.workspace = os.path.join(root, "agent-tools",
                                               "agent-workspace")
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+                FileNotFoundError, ValueError):
             # Fallback to current directory logic
             self.workspace = os.path.join(os.getcwd(), "agent-workspace")
 
         os.makedirs(self.workspace, exist_ok=True)
+        os.makedirs(self.cache_dir, exist_ok=True)
 
     def _detect_repo(self):
-        """Auto-detects current repository from git remote (local check preferred)."""
-        # 1. Try local git remote first (fast, no network)
+        """
+        Auto-detects current repository from git remote (local check preferred).
+        The client is lazy, so this builds the Repository without an API call.
+        """
+        return self.g.get_repo(self._detect_full_name())
+
+    def _save_json_cache(self, path, cache):
+        """
+        Writes a JSON cache file under the cache dir. Failures are non-fatal.
+        The file is written to a temporary sibling and renamed into place, so
+        readers (including concurrent runs) never see a partial file.
+        """
+        tmp_path = None
         try:
-            # Get origin URL
-            res = subprocess.run(
-                ["git", "config", "--get", "remote.origin.url"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=GIT_SHORT_TIMEOUT,
-            )
-            url = res.stdout.strip()
-
-            # Extract owner/repo using regex
-            # Matches: https://github.com/owner/repo.git, git@github.com:owner/repo.git, etc.
-            match = re.search(r"github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$",
-                              url)
-            if match:
-                full_name = f"{match.group(1)}/{match.group(2)}"
-                return self.g.get_repo(full_name)
-        except (
-                subprocess.CalledProcessError,
-                subprocess.TimeoutExpired,
-                FileNotFoundError,
-        ):
-            # Ignore local errors and fall back to gh
-            self._log("Local git remote check failed, falling back to 'gh'...")
-            pass
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory,
+                                            prefix=os.path.basename(path),
+                                            suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(_json_bytes(cache))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self._log(f"Warning: Could not write cache {path}: {e}")
+            if tmp_path:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+
+    def _write_repo_cache(self, full_name):
+        """Remembers the repository resolved for the current directory."""
+        path = os.path.join(self.cache_dir, REPO_CACHE_FILENAME)
+        cache = _load_json_cache(path)
+        cache[os.getcwd()] = full_name
+        self._save_json_cache(path, cache)
+
+    def _detect_full_name(self):
+        """Returns: 'owner/name' of the current repository."""
+        # 1. Parse .git/config in-process (fast, no subprocess, no network)
+        url = _read_origin_url()
+        match = REMOTE_URL_RE.search(url) if url else None
+        if match:
+            return f"{match.group(1)}/{match.group(2)}"
+
+        # 2. Previously resolved by one of the slower fallbacks below
+        full_name = _load_json_cache(
+            os.path.join(self.cache_dir, REPO_CACHE_FILENAME)).get(os.getcwd())
+        if full_name:
+            return full_name
+
+        # 3. Ask git when .git/config couldn't be read (worktrees, GIT_DIR)
+        if url is None:
+            try:
+                res = subprocess.run(
+                    [_git_path(), "config", "--get", "remote.origin.url"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=GIT_SHORT_TIMEOUT,
+                )
+                url = res.stdout.strip()
+
+                match = REMOTE_URL_RE.search(url)
+                if match:
+                    full_name = f"{match.group(1)}/{match.group(2)}"
+                    self._write_repo_cache(full_name)
+                    return full_name
+            except (
+                    subprocess.CalledProcessError,
+                    subprocess.TimeoutExpired,
+                    FileNotFoundError,
+            ):
+                # Ignore local errors and fall back to gh
+                self._log("Local git remote check failed, falling back to 'gh'...")
 
-        # 2. Fallback to gh CLI (slower, network dependent)
+        # 4. Fallback to gh CLI (slower, network dependent)
         try:
             res = subprocess.run(
-                ["gh", "repo", "view", "--json", "owner,name"],
+                [_gh_path(), "repo", "view", "--json", "owner,name"],
                 capture_output=True,
                 text=True,
                 check=True,
@@ -183,7 +655,8 @@ class ReviewManager:
             )
             data = json.loads(res.stdout)
             full_name = f"{data['owner']['login']}/{data['name']}"
-            return self.g.get_repo(full_name)
+            self._write_repo_cache(full_name)
+            return full_name
         except (
                 subprocess.CalledProcessError,
                 FileNotFoundError,
@@ -194,129 +667,209 @@ class ReviewManager:
                 "Error checking repository context: Ensure 'gh' is installed and you are in a git repository."
             ) from None
 
+    @staticmethod
+    def _run_git_stream(args, timeout=GIT_SHORT_TIMEOUT):
+        """
+        Runs a read-only git command and yields its stdout lines as they arrive,
+        without buffering the whole output. Closing the generator early kills git.
+        Raises CalledProcessError / TimeoutExpired like subprocess.run(check=True).
+        """
+        cmd = [_git_path(), *args]
+        # GIT_OPTIONAL_LOCKS=0 skips the opportunistic index refresh/write-back
+        # (and its lock) that commands like 'git status' otherwise perform
+        with subprocess.Popen(cmd,
+                              stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL,
+                              text=True,
+                              env={
+                                  **os.environ, "GIT_OPTIONAL_LOCKS": "0"
+                              }) as proc:
+            # Reading the pipe has no timeout of its own: kill git if it hangs
+            watchdog = threading.Timer(timeout, proc.kill)
+            watchdog.start()
+            completed = False
+            try:
+                for line in proc.stdout:
+                    yield line.rstrip("\n")
+                completed = True
+            finally:
+                # Timer.cancel() is a no-op once fired; read the flag first
+                timed_out = watchdog.finished.is_set()
+                watchdog.cancel()
+                if not completed:
+                    proc.kill()
+                returncode = proc.wait()
+        if timed_out:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
+    def _read_branch_status(self):
+        """
+        Reads working-tree and branch state with a single git process.
+        Parses 'git status --porcelain=v2 --branch' headers:
+            # branch.head <name>          ("(detached)" when detached)
+            # branch.upstream <name>      (absent when no upstream)
+            # branch.ab +<ahead> -<behind> (absent when upstream is gone)
+        Any non-header line is a changed or untracked file. Headers come first,
+        so output is streamed and git is stopped at the first changed entry
+        instead of buffering the whole changeset.
+        Returns: dict with head, upstream, ahead, behind and dirty keys.
+        """
+        state = {
+            "head": None,
+            "upstream": None,
+            "ahead": None,
+            "behind": None,
+            "dirty": False,
+        }
+        # Stopping early (closing the generator) kills git: nothing after the
+        # first changed entry is needed
+        with closing(
+                self._run_git_stream(["status", "--porcelain=v2",
+                                      "--branch"])) as lines:
+            for line in lines:
+                if line.startswith("# branch.head "):
+                    state["head"] = line[len("# branch.head "):]
+                elif line.startswith("# branch.upstream "):
+                    state["upstream"] = line[len("# branch.upstream "):]
+                elif line.startswith("# branch.ab "):
+                    ahead, _, behind = line[len("# branch.ab "):].partition(" ")
+                    state["ahead"] = int(ahead.lstrip("+"))
+                    state["behind"] = int(behind.lstrip("-"))
+                elif line and not line.startswith("#"):
+                    state["dirty"] = True
+                    break
+        return state
+
+    @staticmethod
+    def _validate_branch_status(state):
+        """
+        Checks a parsed branch status for a clean tree on a named branch.
+        Returns: (is_valid, branch_name_or_error_msg)
+        """
+        if state["dirty"]:
+            return (
+                False,
+                "Uncommitted changes detected. Please commit or stash them first.",
+            )
+        if not state["head"] or state["head"] == "(detached)":
+            return False, "Detached HEAD state detected. Please checkout a branch."
+        return True, state["head"]
+
     def _verify_clean_git(self):
         """
         Helper to check that the working directory is clean and we are on a valid branch.
-        Returns: (is_valid, branch_name_or_error_msg)
+        Returns: (is_valid, branch_name_or_error_msg, upstream_or_None)
         """
         try:
-            # 1. Check for uncommitted changes
-            status_proc = subprocess.run(
-                ["git", "status", "--porcelain"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=GIT_SHORT_TIMEOUT,
-            )
-            if status_proc.stdout.strip():
-                return (
-                    False,
-                    "Uncommitted changes detected. Please commit or stash them first.",
-                )
+            state = self._read_branch_status()
+        except (subprocess.CalledProcessError, FileNotFoundError,
+                ValueError) as e:
+            return False, f"Git check failed: {self._mask_token(str(e))}", None
+        except subprocess.TimeoutExpired:
+            return False, "Git check timed out.", None
 
-            # 2. Get current branch
-            branch_proc = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        is_valid, branch_or_msg = self._validate_branch_status(state)
+        return is_valid, branch_or_msg, state["upstream"]
+
+    def _remote_branch_unchanged(self, state):
+        """
+        Asks GitHub (conditional GET, usually a free 304) for the upstream
+        branch tip and compares it to the local remote-tracking ref.
+        Returns: True when a 'git fetch' would not change the upstream.
+        """
+        upstream = state["upstream"]
+        if not upstream or not upstream.startswith("origin/"):
+            return False
+        branch = upstream[len("origin/"):]
+        path = os.path.join(self.cache_dir, REF_CACHE_FILENAME)
+        cache = _load_json_cache(path)
+        fresh = {}
+        try:
+            local_sha = subprocess.run(
+                [_git_path(), "rev-parse", "--verify", f"refs/remotes/{upstream}"],
                 capture_output=True,
                 text=True,
                 check=True,
                 timeout=GIT_SHORT_TIMEOUT,
-            )
-            branch = branch_proc.stdout.strip()
-            if branch == "HEAD":
-                return False, "Detached HEAD state detected. Please checkout a branch."
-
-            return True, branch
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
-            return False, f"Git check failed: {self._mask_token(str(e))}"
-        except subprocess.TimeoutExpired:
-            return False, "Git check timed out."
-
-    def _check_local_state(self):
+            ).stdout.strip()
+            ref, _ = self._get_cached_page(
+                f"{self.repo.url}/git/ref/heads/{quote(branch)}", None,
+                cache, fresh)
+        except (GithubException, subprocess.CalledProcessError,
+                subprocess.TimeoutExpired, OSError):
+            # OSError also covers requests' ConnectionError/Timeout: any
+            # failure here just means falling back to a plain git fetch
+            return False
+        cache.update(fresh)
+        self._save_json_cache(path, cache)
+        return ref["object"]["sha"] == local_sha
+
+    def _check_local_state(self, fetch=True):
         """
         Verifies:
-        1. Clean git status (implemented in helper).
+        1. Clean git status.
         2. Pushed to remote (upstream sync).
+        Both come from a single 'git status --porcelain=v2 --branch' run after fetching.
+        The fetch is skipped when GitHub reports the upstream tip we already have.
+        With fetch=False the upstream is compared as last fetched (no network);
+        unpushed commits are still detected, being behind may not be.
         """
+        try:
+            state = self._read_branch_status()
+            # A dirty tree or detached HEAD fails regardless of the remote:
+            # report it without probing GitHub or fetching
+            is_clean, branch_or_msg = self._validate_branch_status(state)
+            if not is_clean:
+                return False, branch_or_msg
+            if fetch and self._remote_branch_unchanged(state):
+                self._log(
+                    f"Upstream '{state['upstream']}' is current; skipping git fetch."
+                )
+            elif fetch:
+                # Fetch latest state from remote for accurate comparison
+                # (remote-tracking refs only: nothing here reads FETCH_HEAD)
+                # Suppress stdout to avoid polluting structured output; inherit stderr so prompts/hangs remain visible
+                subprocess.run(
+                    [_git_path(), "fetch", "--no-write-fetch-head"],
+                    check=True,
+                    timeout=GIT_FETCH_TIMEOUT,
+                    stdout=subprocess.DEVNULL,
+                )
+                state = self._read_branch_status()
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+                FileNotFoundError, ValueError) as e:
+            return False, f"Git check failed: {self._mask_token(str(e))}"
+
         # 1. Check local cleanliness
-        is_clean, branch_or_msg = self._verify_clean_git()
+        is_clean, branch_or_msg = self._validate_branch_status(state)
         if not is_clean:
             return False, branch_or_msg
 
         branch = branch_or_msg
 
         # 2. Check if pushed to upstream
-        try:
-            # Fetch latest state from remote for accurate comparison
-            # Suppress stdout to avoid polluting structured output; inherit stderr so prompts/hangs remain visible
-            subprocess.run(
-                ["git", "fetch"],
-                check=True,
-                timeout=GIT_FETCH_TIMEOUT,
-                stdout=subprocess.DEVNULL,
+        if state["upstream"] is None:
+            return (
+                False,
+                f"No upstream configured for branch '{branch}'. Please 'git push -u origin {branch}' first.",
             )
-
-            # Get current branch
-            branch = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=GIT_SHORT_TIMEOUT,
-            ).stdout.strip()
-
-            # Check if upstream is configured
-            upstream_proc = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "@{u}"],
-                capture_output=True,
-                text=True,
-                timeout=GIT_SHORT_TIMEOUT,
+        if state["ahead"] is None:
+            return (
+                False,
+                f"Upstream '{state['upstream']}' for branch '{branch}' no longer exists. Please 'git push -u origin {branch}' first.",
             )
-            if upstream_proc.returncode != 0:
-                return (
-                    False,
-                    f"No upstream configured for branch '{branch}'. Please 'git push -u origin {branch}' first.",
-                )
-
-            # Check for unpushed commits and upstream changes
-            # git rev-list --left-right --count @{u}...HEAD
-            # Output: "behind  ahead" (left=@{u}, right=HEAD)
-            rev_list = subprocess.run(
-                ["git", "rev-list", "--left-right", "--count", "@{u}...HEAD"],
-                capture_output=True,
-                text=True,
-                timeout=GIT_SHORT_TIMEOUT,
+        if state["ahead"] > 0:
+            return (
+                False,
+                f"Local branch '{branch}' has {state['ahead']} unpushed commit(s). You MUST push before triggering a review.",
+            )
+        if state["behind"] > 0:
+            return (
+                False,
+                f"Local branch '{branch}' is behind upstream by {state['behind']} commit(s). Please pull.",
             )
-            if rev_list.returncode == 0:
-                try:
-                    parts = rev_list.stdout.split()
-                    if len(parts) == 2:
-                        behind, ahead = int(parts[0]), int(parts[1])
-                        if ahead > 0:
-                            return (
-                                False,
-                                f"Local branch '{branch}' has {ahead} unpushed commit(s). You MUST push before triggering a review.",
-                            )
-                        if behind > 0:
-                            return (
-                                False,
-                                f"Local branch '{branch}' is behind upstream by {behind} commit(s). Please pull.",
-                            )
-                    else:
-                        return (
-                            False,
-                            f"Unexpected git rev-list output: '{rev_list.stdout.strip()}'",
-                        )
-                except ValueError:
-                    return (
-                        False,
-                        f"Failed to parse git rev-list output: '{rev_list.stdout.strip()}'",
-                    )
-            else:
-                # Fallback/General error
-                return False, f"Failed to check divergence: {rev_list.stderr.strip()}"
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-            return False, f"Git check failed: {self._mask_token(str(e))}"
 
         return True, "Code is clean and pushed."
 
@@ -325,7 +878,7 @@ class ReviewManager:
         self._log("Running safe_push verification...")
 
         # 1. Check local cleanliness using helper
-        is_clean, branch_or_msg = self._verify_clean_git()
+        is_clean, branch_or_msg, upstream = self._verify_clean_git()
         if not is_clean:
             # Map helper error to JSON format
             return {
@@ -336,40 +889,18 @@ class ReviewManager:
 
         branch = branch_or_msg
 
-        # Separately check upstream
-
-        # Separately check upstream
-        try:
-            upstream_proc = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "@{u}"],
-                capture_output=True,
-                text=True,
-                timeout=GIT_SHORT_TIMEOUT,
-            )
-            if upstream_proc.returncode != 0:
-                return {
-                    "status": "error",
-                    "message":
-                    f"No upstream configured for branch '{branch}'. Please 'git push -u origin {branch}' first.",
-                    "next_step": "Configure upstream and retry safe_push.",
-                }
-        except subprocess.TimeoutExpired:
-            return {
-                "status": "error",
-                "message": "Git upstream check timed out."
-            }
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # This can happen if 'git rev-parse --abbrev-ref @{u}' fails for other reasons
+        # Upstream comes from the same git status call, no extra process needed
+        if upstream is None:
             return {
                 "status": "error",
                 "message":
-                f"Failed to determine upstream for branch '{branch}'. Please ensure it's configured.",
-                "next_step": "Check git configuration and retry safe_push.",
+                f"No upstream configured for branch '{branch}'. Please 'git push -u origin {branch}' first.",
+                "next_step": "Configure upstream and retry safe_push.",
             }
 
         # Attempt push
         try:
-            subprocess.run(["git", "push"],
+            subprocess.run([_git_path(), "push"],
                            check=True,
                            timeout=GIT_PUSH_TIMEOUT)
             return {
@@ -393,6 +924,161 @@ class ReviewManager:
                 "Pull changes, resolve conflicts, and retry safe_push.",
             }
 
+    def _pr_unchanged(self, pr_number):
+        """
+        Cheap change probe: conditional GET on the PR with its last seen ETag.
+        A 304 reply has no body and does not count against the rate limit.
+        Returns True only when GitHub confirms nothing changed since the last probe.
+        """
+        headers = {}
+        etag = self._pr_etags.get(pr_number)
+        if etag:
+            headers["If-None-Match"] = etag
+        response_headers, data = self.g.requester.requestJsonAndCheck(
+            "GET", f"{self.repo.url}/pulls/{pr_number}", headers=headers)
+        if data is None:
+            # 304 Not Modified
+            return True
+        self._pr_etags[pr_number] = response_headers.get("etag")
+        return False
+
+    def _wait_for_first_feedback(self, pr_number, since_dt, ignore_ids,
+                                 wait_seconds):
+        """
+        Waits up to wait_seconds for the first new issue comment on the PR.
+        Probes every INITIAL_WAIT_STEP_SECONDS with a conditional request, so
+        repeated probes answer 304 until something is posted.
+        Returns: True as soon as a comment (other than ignore_ids) appears.
+        """
+        url = f"{self.repo.url}/issues/{pr_number}/comments"
+        parameters = {"since": since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")}
+        cache = {}
+        waited = 0
+        while waited < wait_seconds:
+            step = min(INITIAL_WAIT_STEP_SECONDS, wait_seconds - waited)
+            self._interruptible_sleep(step)
+            waited += step
+            fresh = {}
+            comments, _ = self._get_cached_page(url, parameters, cache, fresh)
+            cache = fresh
+            if any(c["id"] not in ignore_ids for c in comments or []):
+                self._log(f"First feedback arrived after {waited}s.")
+                return True
+        return False
+
+    def _main_reviewer_active_since(self, pr_number, since_dt,
+                                    validation_reviewer):
+        """
+        Cheap poll check: one GraphQL query over the PR's latest reviews and
+        comments, looking for activity by the main reviewer since since_dt.
+        Returns: True if the main reviewer posted (or the check was inconclusive).
+        """
+        owner, name = self.repo.full_name.split("/", 1)
+        try:
+            data = self._graphql(REVIEWER_ACTIVITY_QUERY, {
+                "owner": owner,
+                "name": name,
+                "number": pr_number
+            })
+        except GithubException as e:
+            if self._is_retryable(e):
+                raise
+            self._log(
+                f"Reviewer activity query failed ({e.status}); using full fetch."
+            )
+            return True
+
+        pull = data["repository"]["pullRequest"]
+        entries = [(node, "submittedAt") for node in pull["reviews"]["nodes"]]
+        entries += [(node, "updatedAt") for node in pull["comments"]["nodes"]]
+        entries += [(node, "updatedAt")
+                    for thread in pull["reviewThreads"]["nodes"]
+                    for node in thread["comments"]["nodes"]]
+
+        for node, time_field in entries:
+            author = node["author"]
+            if not author:
+                continue
+            # GraphQL reports bot logins without the REST "[bot]" suffix
+            login = author["login"]
+            if author["__typename"] == "Bot":
+                login += "[bot]"
+            node_dt = _parse_api_datetime(node[time_field])
+            if (login == validation_reviewer and node_dt
+                    and node_dt >= since_dt):
+                return True
+        return False
+
+    @staticmethod
+    def _has_reviewer_items(status_data, validation_reviewer):
+        """Returns: True when status_data's new items (since the poll's 'since') include the main reviewer's."""
+        return any(
+            item.get("user") == validation_reviewer
+            for item in status_data.get("items", []))
+
+    @staticmethod
+    def _rate_limit_delay(error):
+        """Returns: seconds the error's Retry-After / X-RateLimit-Reset headers ask to wait (0 if none)."""
+        headers = {k.lower(): v for k, v in (error.headers or {}).items()}
+        try:
+            if "retry-after" in headers:
+                return max(int(headers["retry-after"]), 0)
+            if headers.get("x-ratelimit-remaining") == "0":
+                return max(int(headers["x-ratelimit-reset"]) - time.time(), 0)
+        except (KeyError, ValueError):
+            pass
+        return 0
+
+    def _record_rate_limit(self, error):
+        """
+        Persists the end of a rate-limit window in the cache dir, so later
+        invocations (a new 'status' or 'wait') hold off instead of hitting the
+        limit again and escalating to secondary rate limiting.
+        """
+        delay = self._rate_limit_delay(error)
+        if delay > 0:
+            self._save_json_cache(
+                os.path.join(self.cache_dir, RATE_LIMIT_FILENAME),
+                {"until": time.time() + delay})
+
+    def _rate_limit_remaining(self):
+        """Returns: seconds left in a recorded rate-limit window (0 if none)."""
+        state = _load_json_cache(
+            os.path.join(self.cache_dir, RATE_LIMIT_FILENAME))
+        try:
+            return max(float(state.get("until", 0)) - time.time(), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _is_retryable(error):
+        """
+        Returns: True for rate limits and transient server errors. A 403 is
+        also how GitHub reports permission failures, so it only counts when
+        the rate-limit headers or a secondary rate limit message say so.
+        """
+        if error.status not in RETRYABLE_STATUSES:
+            return False
+        if error.status != 403:
+            return True
+        data = error.data
+        message = data.get("message") if isinstance(data, dict) else data
+        return (ReviewManager._rate_limit_delay(error) > 0
+                or "rate limit" in str(message or "").lower())
+
+    @staticmethod
+    def _error_backoff_delay(error, poll_interval, consecutive_failures):
+        """
+        Delay before retrying a poll after a retryable GitHub error: exponential
+        in the number of consecutive failures (capped), never shorter than what
+        Retry-After / X-RateLimit-Reset ask for, plus jitter.
+        """
+        header_delay = ReviewManager._rate_limit_delay(error)
+        backoff = min(poll_interval * 2**consecutive_failures,
+                      POLL_ERROR_MAX_DELAY_SECONDS)
+        return (max(header_delay, backoff) +
+                random.uniform(0, POLL_ERROR_JITTER_SECONDS))
+
     def _poll_for_main_reviewer(
         self,
         pr_number,
@@ -405,50 +1091,138 @@ class ReviewManager:
         Polls until the main reviewer has provided feedback since the given timestamp.
         Enforces the Loop Rule: never return until main reviewer responds or timeout.
 
+        Each attempt first sends a conditional PR request; when the PR changed,
+        a single GraphQL query checks for main reviewer activity, and the full
+        feedback fetch only runs when there is some. The wait between attempts
+        starts at half the poll interval and doubles while the PR stays idle,
+        up to POLL_MAX_INTERVAL_SECONDS, with +/-POLL_JITTER_FRACTION jitter.
+        The loop ends after max_attempts or POLL_TIMEOUT_SECONDS of wall-clock
+        time, whichever comes first; no wait runs past that deadline.
+        Rate-limit and transient server errors back off exponentially (with
+        jitter) instead of aborting the loop.
+
         Returns the status data from check_status once main reviewer feedback is detected.
         """
         max_attempts = POLL_MAX_ATTEMPTS if max_attempts is None else max_attempts
         poll_interval = (POLL_INTERVAL_SECONDS
-                         if poll_interval is None else poll_interval)
+                         if poll_interval is None else max(poll_interval, 1))
+        deadline = time.monotonic() + POLL_TIMEOUT_SECONDS
+        base_delay = max(poll_interval // 2, 1)
+        delay = base_delay
+        waited = 0
+        consecutive_failures = 0
+        try:
+            since_dt = _parse_api_datetime(since_iso) or EPOCH
+        except ValueError:
+            since_dt = None
+        # True when a change was seen but the full status was not re-fetched
+        status_stale = False
 
         # Initialize status_data to handle edge case where max_attempts is 0 or loop is interrupted
         status_data = None
 
         for attempt in range(1, max_attempts + 1):
             try:
-                self._log(f"Poll attempt {attempt}/{max_attempts}...")
+                # Terminated (e.g. during the initial wait): stop before any request
+                if self._stop_event.is_set():
+                    raise KeyboardInterrupt
+                if attempt > 1 and time.monotonic() >= deadline:
+                    break
+
+                # Honour a rate-limit window recorded by this or another run
+                pending = min(self._rate_limit_remaining(),
+                              max(deadline - time.monotonic(), 0))
+                if pending:
+                    self._log(
+                        f"GitHub rate limit in effect; waiting {pending:.0f}s...")
+                    self._interruptible_sleep(pending)
+                    waited += pending
+                    if time.monotonic() >= deadline:
+                        break
 
-                # Get current status
-                status_data = self.check_status(
-                    pr_number,
-                    since_iso=since_iso,
-                    return_data=True,
-                    validation_reviewer=validation_reviewer,
-                )
+                self._log(f"Poll attempt {attempt}/{max_attempts}...")
 
-                # Check for any NEW feedback from main reviewer in items (filtered by since_iso)
-                # IMPORTANT: Do NOT check main_reviewer_state here - that reflects ALL historical reviews
-                # and would cause immediate exit if main reviewer ever commented before.
-                # We only want to exit when the main reviewer has posted NEW feedback since trigger.
-                main_reviewer_has_new_feedback = any(
-                    item.get("user") == validation_reviewer
-                    for item in status_data.get("items", []))
-
-                if main_reviewer_has_new_feedback:
-                    main_reviewer_info = status_data.get("main_reviewer", {})
-                    main_reviewer_state = main_reviewer_info.get(
-                        "state", "PENDING")
+                # Probe first so the stored ETag predates the fetch below;
+                # skip the fetch when the PR has not changed since last time.
+                try:
+                    unchanged = (self._pr_unchanged(pr_number)
+                                 and status_data is not None)
+                    # On a change, ask GraphQL whether the main reviewer
+                    # posted before paying for the full paginated fetch.
+                    skip_fetch = (not unchanged and status_data is not None
+                                  and since_dt is not None
+                                  and not self._main_reviewer_active_since(
+                                      pr_number, since_dt,
+                                      validation_reviewer))
+                    if not unchanged and not skip_fetch:
+                        fetched = self.check_status(
+                            pr_number,
+                            since_iso=since_iso,
+                            return_data=True,
+                            validation_reviewer=validation_reviewer,
+                        )
+                except GithubException as e:
+                    if not self._is_retryable(e):
+                        raise
+                    self._record_rate_limit(e)
+                    consecutive_failures += 1
+                    error_delay = self._error_backoff_delay(
+                        e, poll_interval, consecutive_failures)
+                    self._log(
+                        f"GitHub API error {e.status} (failure #{consecutive_failures}). "
+                        f"Backing off {error_delay:.0f}s before next poll...")
+                    if attempt < max_attempts:
+                        error_delay = min(error_delay,
+                                          max(deadline - time.monotonic(), 0))
+                        self._interruptible_sleep(error_delay)
+                        waited += error_delay
+                    continue
+                consecutive_failures = 0
+
+                if unchanged:
                     self._log(
-                        f"Main reviewer ({validation_reviewer}) has NEW feedback with state: {main_reviewer_state}"
+                        "PR unchanged since last poll (304 Not Modified).")
+                elif skip_fetch:
+                    # PR changed, but not by the main reviewer
+                    delay = base_delay
+                    status_stale = True
+                    self._log(
+                        "PR changed without main reviewer activity; skipping full fetch."
                     )
-                    return status_data
+                else:
+                    # PR changed: reset the idle backoff
+                    delay = base_delay
+                    status_data = fetched
+                    status_stale = False
+
+                    # Check for any NEW feedback from main reviewer in items (filtered by since_iso)
+                    # IMPORTANT: Do NOT check main_reviewer_state here - that reflects ALL historical reviews
+                    # and would cause immediate exit if main reviewer ever commented before.
+                    # We only want to exit when the main reviewer has posted NEW feedback since trigger.
+                    if self._has_reviewer_items(status_data,
+                                                validation_reviewer):
+                        main_reviewer_info = status_data.get(
+                            "main_reviewer", {})
+                        main_reviewer_state = main_reviewer_info.get(
+                            "state", "PENDING")
+                        self._log(
+                            f"Main reviewer ({validation_reviewer}) has NEW feedback with state: {main_reviewer_state}"
+                        )
+                        return status_data
 
-                # Not yet - wait and poll again
+                # Not yet - wait and poll again, backing off while idle
                 if attempt < max_attempts:
+                    # +/-20% jitter keeps concurrent pollers from syncing up
+                    sleep_for = min(
+                        delay * random.uniform(1 - POLL_JITTER_FRACTION,
+                                               1 + POLL_JITTER_FRACTION),
+                        max(deadline - time.monotonic(), 0))
                     self._log(
-                        f"Main reviewer has not responded yet. Waiting {poll_interval}s before next poll..."
+                        f"Main reviewer has not responded yet. Waiting {sleep_for:.0f}s before next poll..."
                     )
-                    time.sleep(poll_interval)
+                    self._interruptible_sleep(sleep_for)
+                    waited += sleep_for
+                    delay = min(delay * 2, POLL_MAX_INTERVAL_SECONDS)
             except KeyboardInterrupt:
                 self._log("\nPolling interrupted by user.")
                 # Return distinct status for interruption vs timeout
@@ -465,9 +1239,30 @@ class ReviewManager:
 
         # Timeout - return status with warning
         self._log(
-            f"WARNING: Main reviewer did not respond within {max_attempts * poll_interval}s timeout."
+            f"WARNING: Main reviewer did not respond within {waited:.0f}s timeout."
         )
 
+        # Report the latest feedback, not the snapshot from the last full fetch
+        # (unless terminated, which must not start another full fetch)
+        if status_stale and not self._stop_event.is_set():
+            try:
+                status_data = self.check_status(
+                    pr_number,
+                    since_iso=since_iso,
+                    return_data=True,
+                    validation_reviewer=validation_reviewer,
+                )
+            except GithubException as e:
+                self._log(
+                    f"Final status refresh failed: {self._mask_token(str(e))}")
+            else:
+                # The activity pre-check can lag: report feedback the refresh found
+                if self._has_reviewer_items(status_data, validation_reviewer):
+                    self._log(
+                        f"Main reviewer ({validation_reviewer}) has NEW feedback (found by final refresh)."
+                    )
+                    return status_data
+
         # Handle case where no polls were made (e.g., max_attempts was 0)
         if status_data is None:
             status_data = {
@@ -481,11 +1276,39 @@ class ReviewManager:
         )
         return status_data
 
+    def _graphql(self, query, variables):
+        """Runs a GraphQL query/mutation. Returns: the response's data object."""
+        return self.g.requester.graphql_query(query, variables)[1]["data"]
+
+    def _post_comments(self, subject_id, bodies):
+        """
+        Posts each body as a separate comment on the given node (PR) with one
+        aliased GraphQL mutation instead of one REST call per comment.
+        Returns: dict mapping each body to the database id of its comment.
+        """
+        params = ", ".join(f"$b{i}: String!" for i in range(len(bodies)))
+        fields = "\n".join(
+            f"  c{i}: addComment(input: {{subjectId: $id, body: $b{i}}}) "
+            "{ commentEdge { node { databaseId } } }"
+            for i in range(len(bodies)))
+        query = f"mutation($id: ID!, {params}) {{\n{fields}\n}}"
+        variables = {"id": subject_id}
+        variables.update({f"b{i}": body for i, body in enumerate(bodies)})
+
+        data = self._graphql(query, variables)
+        # Aliases c0..cN map back to the bodies in order
+        return {
+            body: data[f"c{i}"]["commentEdge"]["node"]["databaseId"]
+            for i, body in enumerate(bodies)
+        }
+
     def trigger_review(
         self,
         pr_number,
         wait_seconds=180,
         validation_reviewer=DEFAULT_VALIDATION_REVIEWER,
+        fetch=True,
+        poll_interval=None,
     ):
         """
         1. Checks local state (Hard Constraint).
@@ -493,7 +1316,7 @@ class ReviewManager:
         3. Polls for main reviewer feedback.
         """
         # Step 1: Enforce Push
-        is_safe, msg = self._check_local_state()
+        is_safe, msg = self._check_local_state(fetch=fetch)
         if not is_safe:
             print_error(
                 f"FAILED: {msg}\nTip: Use the 'safe_push' tool or run 'git push' manually."
@@ -502,7 +1325,15 @@ class ReviewManager:
         self._log(f"State verified: {msg}")
 
         # Capture start time for status check
-        start_time = datetime.now(timezone.utc)
+        start_time = datetime.now(UTC)
+
+        if self._stop_event.is_set():
+            return {
+                "status": "interrupted",
+                "message": "Terminated before triggering reviews; nothing was posted.",
+                "triggered_bots": [],
+                "next_step": "Run 'trigger_review' again to request reviews.",
+            }
 
         # Step 2: Trigger Bots
         triggered_bots = []
@@ -510,8 +1341,11 @@ class ReviewManager:
             pr = self.repo.get_pull(pr_number)
             self._log(f"Triggering reviews on PR #{pr_number} ({pr.title})...")
 
-            for cmd in REVIEW_COMMANDS:
-                pr.create_issue_comment(cmd)
+            # Each bot command must be its own comment, but all of them are
+            # posted by one batched GraphQL mutation (a single round-trip).
+            posted = self._post_comments(pr.node_id, REVIEW_COMMANDS)
+            trigger_ts = datetime.now(UTC)
+            for cmd in posted:
                 self._log(f"  Posted: {cmd}")
                 triggered_bots.append(cmd)
 
@@ -521,13 +1355,22 @@ class ReviewManager:
             if wait_seconds > 0:
                 self._log("-" * 40)
                 self._log(
-                    f"Auto-waiting {wait_seconds} seconds for initial bot responses..."
+                    f"Waiting up to {wait_seconds} seconds for initial bot responses..."
                 )
                 try:
-                    time.sleep(wait_seconds)
+                    self._wait_for_first_feedback(pr_number, trigger_ts,
+                                                  set(posted.values()),
+                                                  wait_seconds)
                 except KeyboardInterrupt:
                     self._log(
                         "\nWait interrupted. Checking status immediately...")
+                except (GithubException, OSError) as e:
+                    # The early exit is only an optimisation: the triggers are
+                    # already posted, so never fail here (re-triggering would
+                    # duplicate the bot comments); fall through to the poll
+                    self._log(
+                        f"Initial wait probe failed: {self._mask_token(str(e))}. Polling for status..."
+                    )
 
                 self._log("-" * 40)
                 self._log(
@@ -539,6 +1382,7 @@ class ReviewManager:
                     pr_number=pr_number,
                     since_iso=start_time.isoformat(),
                     validation_reviewer=validation_reviewer,
+                    poll_interval=poll_interval,
                 )
             else:
                 status_data = {
@@ -575,205 +1419,359 @@ class ReviewManager:
         except GithubException as e:
             print_error(f"GitHub API Error: {self._mask_token(str(e))}")
 
+    @staticmethod
+    def _login(user):
+        """Returns the login of a raw API user object ('ghost' for deleted accounts)."""
+        return user["login"] if user else "ghost"
+
+    def _pr_cache_path(self, pr_number):
+        return os.path.join(self.cache_dir, PR_CACHE_DIRNAME,
+                            f"{pr_number}.json")
+
+    def _get_cached_page(self, url, parameters, cache, fresh):
+        """
+        Conditional GET of one API page: sends If-None-Match with the cached ETag
+        (and If-Modified-Since with the cached Last-Modified) and reuses the
+        cached payload on 304 (which costs no rate limit).
+        Entries used by this call are copied into `fresh` so stale ones get pruned.
+        Returns: (payload, Link header)
+        """
+        key = url
+        if parameters:
+            key += "?" + "&".join(f"{k}={v}"
+                                  for k, v in sorted(parameters.items()))
+        cached = cache.get(key)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+        response_headers, data = self.g.requester.requestJsonAndCheck(
+            "GET", url, parameters=parameters, headers=headers)
+        if data is None and cached:
+            # 304 Not Modified
+            fresh[key] = cached
+            return cached["data"], cached.get("link")
+
+        fresh[key] = {
+            "etag": response_headers.get("etag"),
+            "last_modified": response_headers.get("last-modified"),
+            "link": response_headers.get("link"),
+            "data": data,
+        }
+        return data, response_headers.get("link")
+
+    def _get_all_pages(self, url, parameters, cache, fresh):
+        """
+        Fetches every page of a list endpoint through the conditional cache.
+        When the first page advertises the last page number, the remaining
+        pages are requested concurrently over the pooled connections;
+        otherwise the next links are followed one by one.
+        """
+        data, link = self._get_cached_page(url, parameters, cache, fresh)
+        results = list(data or [])
+
+        last = LINK_LAST_RE.search(link or "")
+        page = PAGE_PARAM_RE.search(last.group(1)) if last else None
+        if page:
+            # Page URLs already carry the query string
+            last_page = int(page.group(2))
+            urls = [
+                PAGE_PARAM_RE.sub(rf"\g<1>{n}", last.group(1))
+                for n in range(2, last_page + 1)
+            ]
+            with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as pool:
+                pages = pool.map(
+                    lambda u: self._get_cached_page(u, None, cache, fresh)[0],
+                    urls)
+                for data in pages:
+                    results.extend(data or [])
+            return results
+
+        match = LINK_NEXT_RE.search(link or "")
+        url = match.group(1) if match else None
+        while url:
+            # The next link already carries the query string
+            data, link = self._get_cached_page(url, None, cache, fresh)
+            results.extend(data or [])
+            match = LINK_NEXT_RE.search(link or "")
+            url = match.group(1) if match else None
+        return results
+
+    def _project_item(self, source, raw):
+        """Builds an output item from a raw API object using the source's field table."""
+        item = {"type": source["type"]}
+        for key, raw_key in source["fields"]:
+            value = raw.get(raw_key)
+            if key == "user":
+                value = self._login(value)
+            elif key == "body":
+                value = value or ""
+            elif key.endswith("_at"):
+                value_dt = _parse_api_datetime(value)
+                value = value_dt.isoformat() if value_dt else None
+            item[key] = value
+        return item
+
+    def _fetch_source(self, source, pr_number, since_dt, cache, fresh):
+        """
+        Fetches one feedback source and projects the entries new since since_dt.
+        Returns: (new items, all raw entries)
+        """
+        parameters = {"per_page": GITHUB_PER_PAGE}
+        if source["since"]:
+            parameters["since"] = since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        entries = self._get_all_pages(
+            f"{self.repo.url}/{source['path'].format(pr_number=pr_number)}",
+            parameters,
+            cache,
+            fresh,
+        )
+        # API timestamps are fixed-width UTC ('...Z'), so they sort as strings:
+        # anything before since_dt's second is rejected without parsing
+        cutoff = since_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        items = []
+        for raw in entries:
+            # 'since' has second resolution (and reviews have no 'since' at all);
+            # re-check the exact timestamp. Pending reviews have no submitted_at.
+            raw_time = raw.get(source["time_field"])
+            if not raw_time or raw_time < cutoff:
+                continue
+            if _parse_api_datetime(raw_time) >= since_dt:
+                items.append(self._project_item(source, raw))
+        return items, entries
+
+    def _fetch_feedback(self, pr_number, since_dt):
+        """
+        Fetches all feedback through conditional REST requests, reusing the
+        per-PR ETag cache so unchanged endpoints answer 304 for free.
+        Returns: (new feedback items, all review records)
+        """
+        cache = _load_json_cache(self._pr_cache_path(pr_number))
+        fresh = {}
+
+        # Fetch the feedback sources concurrently: they are independent
+        # endpoints and the work is network-bound (sockets release the GIL).
+        # Results are merged in a fixed order to keep the output stable.
+        with ThreadPoolExecutor(max_workers=len(FEEDBACK_SOURCES)) as executor:
+            futures = [
+                executor.submit(self._fetch_source, source, pr_number,
+                                since_dt, cache, fresh)
+                for source in FEEDBACK_SOURCES
+            ]
+            results = [future.result() for future in futures]
+
+        self._save_json_cache(self._pr_cache_path(pr_number), fresh)
+
+        new_feedback = [item for items, _ in results for item in items]
+        # The reviews source comes last; all of its entries feed the main-reviewer state
+        raw_reviews = results[-1][1]
+        reviews = [{
+            "user": self._login(review["user"]),
+            "state": review["state"],
+            # Raw string: only the main reviewer's approval is ever parsed
+            "submitted_at": review.get("submitted_at"),
+        } for review in raw_reviews]
+        return new_feedback, reviews
+
+    def _next_status_wait(self, pr_number, new_feedback):
+        """
+        Tracks consecutive empty 'status' results per PR in the cache dir and
+        returns the suggested seconds before the next check: doubling from
+        STATUS_WAIT_BASE_SECONDS up to STATUS_WAIT_MAX_SECONDS, reset on any feedback.
+        """
+        path = os.path.join(self.cache_dir, POLL_STATE_FILENAME)
+        state = _load_json_cache(path)
+        key = str(pr_number)
+        empty_polls = 0 if new_feedback else state.get(key, 0) + 1
+        state[key] = empty_polls
+        self._save_json_cache(path, state)
+        return min(STATUS_WAIT_BASE_SECONDS * 2**max(empty_polls - 1, 0),
+                   STATUS_WAIT_MAX_SECONDS)
+
+    def wait_for_feedback(
+        self,
+        pr_number,
+        since_iso=None,
+        validation_reviewer=DEFAULT_VALIDATION_REVIEWER,
+        poll_interval=None,
+    ):
+        """
+        Blocks until the main reviewer posts feedback since the given timestamp
+        (default: now), or the poll budget runs out. Uses the same cheap
+        conditional probes as trigger_review, instead of the agent re-running
+        'status' on a fixed cadence.
+        """
+        if not since_iso:
+            since_iso = datetime.now(UTC).isoformat()
+        self._log(
+            f"Waiting for {validation_reviewer} feedback on PR #{pr_number} since {since_iso}..."
+        )
+        try:
+            return self._poll_for_main_reviewer(
+                pr_number=pr_number,
+                since_iso=since_iso,
+                validation_reviewer=validation_reviewer,
+                poll_interval=poll_interval,
+            )
+        except GithubException as e:
+            print_error(f"GitHub API Error: {self._mask_token(str(e))}")
+
+    @staticmethod
+    def _group_by_user(records):
+        """Returns: {user: [records in their original (chronological) order]}"""
+        by_user = {}
+        for record in records:
+            by_user.setdefault(record.get("user"), []).append(record)
+        return by_user
+
+    @staticmethod
+    def _summarize_feedback(new_feedback, validation_reviewer):
+        """
+        Scans the new feedback once for everything check_status decides on.
+        Returns: (any CHANGES_REQUESTED review,
+                  the main reviewer's own items in order,
+                  any item other than a main reviewer approval)
+        """
+        has_changes_requested = False
+        has_other_feedback = False
+        main_items = []
+        for item in new_feedback:
+            is_review = item.get("type") == "review_summary"
+            state = item.get("state")
+            if is_review and state == "CHANGES_REQUESTED":
+                has_changes_requested = True
+            if item.get("user") == validation_reviewer:
+                main_items.append(item)
+                if is_review and state == "APPROVED":
+                    continue
+            has_other_feedback = True
+        return has_changes_requested, main_items, has_other_feedback
+
+    @staticmethod
+    def _analyze_main_reviewer(own_reviews):
+        """
+        Derives the main reviewer's status from their own reviews (chronological).
+        Tracks latest state AND most recent approval separately
+        (fixes bug where APPROVED -> COMMENTED leaves approval_dt as None).
+        Returns: (latest state or "PENDING", submitted_at of latest approval or None)
+        """
+        if not own_reviews:
+            return "PENDING", None
+        last_approval = next(
+            (review["submitted_at"] for review in reversed(own_reviews)
+             if review["state"] == "APPROVED"),
+            None,
+        )
+        return own_reviews[-1]["state"], _parse_api_datetime(last_approval)
+
+    @staticmethod
+    def _has_comments_since(own_items, approval_dt):
+        """
+        Checks the main reviewer's new items for a comment created at or after
+        their latest approval: issue/inline comments or COMMENTED reviews.
+        """
+        for item in own_items:
+            item_type = item.get("type")
+            if item_type not in COMMENT_ITEM_TYPES and not (
+                    item_type == "review_summary"
+                    and item.get("state") == "COMMENTED"):
+                continue
+
+            # Only use created_at to avoid treating edits (updated_at) of old comments as new feedback.
+            # Items are built by _project_item, so created_at is already a
+            # normalised UTC ISO string (or None); the parse is a cache hit.
+            comment_dt = _parse_api_datetime(item.get("created_at"))
+            if comment_dt is None:
+                continue
+            # Use >= to catch comments made at the exact same second
+            if comment_dt >= approval_dt:
+                return True
+        return False
+
     def check_status(
         self,
         pr_number,
         since_iso=None,
         return_data=False,
         validation_reviewer="gemini-code-assist[bot]",
+        ndjson=False,
+        light=False,
     ):
         """
-        Stateless check of PR feedback using PyGithub.
-        Returns and/or prints JSON summary of status.
+        Check of PR feedback using conditional GitHub REST requests. The result
+        depends only on GitHub; the cache dir holds request caches and, for CLI
+        calls, the empty-result count behind the suggested wait.
+        Returns and/or prints JSON summary of status (as NDJSON if ndjson is set,
+        without comment and review bodies in the printed items if light is set).
         """
 
-        def get_aware_utc_datetime(dt_obj):
-            """Converts a naive datetime from PyGithub into a timezone-aware one."""
-            if dt_obj is None:
-                return None
-            if dt_obj.tzinfo is None:
-                return dt_obj.replace(tzinfo=timezone.utc)
-            return dt_obj.astimezone(timezone.utc)
-
         try:
-            pr = self.repo.get_pull(pr_number)
+            pending = 0 if return_data else self._rate_limit_remaining()
+            if pending:
+                print_error(
+                    f"GitHub rate limit in effect. Wait {pending:.0f}s before running 'status' again."
+                )
 
-            since_dt = datetime(1970, 1, 1, tzinfo=timezone.utc)
+            since_dt = EPOCH
             if since_iso:
                 try:
-                    if since_iso.endswith("Z"):
-                        since_iso = since_iso[:-1] + "+00:00"
-                    since_dt = datetime.fromisoformat(since_iso)
-                    if since_dt.tzinfo is None:
-                        since_dt = since_dt.replace(tzinfo=timezone.utc)
+                    since_dt = _parse_api_datetime(since_iso)
                 except ValueError:
                     # Log warning but continue
-                    print(
-                        f"[{datetime.now(timezone.utc).isoformat()}] [AUDIT] Warning: Invalid timestamp {since_iso}, ignoring.",
-                        file=sys.stderr,
-                    )
+                    self._log(
+                        f"Warning: Invalid timestamp {since_iso}, ignoring.")
+
+            new_feedback, reviews = self._fetch_feedback(pr_number, since_dt)
 
-            # Fetch comments (paginated by PyGithub automatically)
-            new_feedback = []
-
-            # 1. Issue Comments (General)
-            issue = self.repo.get_issue(pr_number)
-            for comment in issue.get_comments(since=since_dt):
-                new_feedback.append({
-                    "type":
-                    "issue_comment",
-                    "user":
-                    comment.user.login,
-                    "body":
-                    comment.body,
-                    "url":
-                    comment.html_url,
-                    "updated_at":
-                    (get_aware_utc_datetime(comment.updated_at).isoformat()
-                     if comment.updated_at else None),
-                    "created_at":
-                    get_aware_utc_datetime(comment.created_at).isoformat(),
-                })
-
-            # 2. Review Comments (Inline)
-            # Fetch all review comments to ensure we catch edits (since param might only check creation time)
-            for comment in pr.get_review_comments():
-                # Use updated_at to catch edits
-                comment_dt = get_aware_utc_datetime(comment.updated_at)
-                if comment_dt and comment_dt >= since_dt:
-                    new_feedback.append({
-                        "type":
-                        "inline_comment",
-                        "user":
-                        comment.user.login,
-                        "body":
-                        comment.body,
-                        "path":
-                        comment.path,
-                        "line":
-                        comment.line,
-                        "created_at": (get_aware_utc_datetime(
-                            comment.created_at).isoformat()
-                            if comment.created_at else None),
-                        "updated_at":
-                        comment_dt.isoformat(),
-                        "url":
-                        comment.html_url,
-                    })
-
-            # 3. Reviews (Approvals/changes requested) - Filter locally
-            # Materialize list for multiple iteration
-            reviews = list(pr.get_reviews())
-            for review in reviews:
-                if (review.submitted_at
-                        ):  # Ensure submitted_at is not None before processing
-                    review_dt = get_aware_utc_datetime(review.submitted_at)
-                    if review_dt and review_dt >= since_dt:
-                        new_feedback.append({
-                            "type":
-                            "review_summary",
-                            "user":
-                            review.user.login,
-                            "state":
-                            review.state,
-                            "body":
-                            review.body,
-                            "created_at":
-                            review_dt.isoformat(),
-                        })
+            # Agent-driven polling ('status' CLI): track empty results on every
+            # check, so any feedback resets the suggested wait
+            status_wait = None
+            if not return_data:
+                status_wait = self._next_status_wait(pr_number, new_feedback)
 
             # Determine next_step based on findings AND validation_reviewer
             next_step = "Wait for reviews."
-            has_changes_requested = any(
-                item.get("state") == "CHANGES_REQUESTED"
-                for item in new_feedback
-                if item.get("type") == "review_summary")
-
-            # Check Main Reviewer Status
-            # Track latest state AND most recent approval separately
-            # (fixes bug where APPROVED -> COMMENTED leaves approval_dt as None)
-            main_reviewer_state = "PENDING"
-            main_reviewer_last_approval_dt = None
-
-            # Single pass: find latest state AND most recent approval timestamp
-            found_latest_state = False
-            for review in reversed(reviews):
-                if review.user.login == validation_reviewer:
-                    if not found_latest_state:
-                        main_reviewer_state = review.state
-                        found_latest_state = True
-
-                    if (main_reviewer_last_approval_dt is None
-                            and review.state == "APPROVED"):
-                        main_reviewer_last_approval_dt = get_aware_utc_datetime(
-                            review.submitted_at)
-
-                    # Exit early if both are found
-                    if (found_latest_state
-                            and main_reviewer_last_approval_dt is not None):
-                        break
+            has_changes_requested, main_items, has_other_feedback = (
+                self._summarize_feedback(new_feedback, validation_reviewer))
+
+            # Index reviews by user once, so the main reviewer checks below
+            # only look at that reviewer's own entries
+            reviews_by_user = self._group_by_user(reviews)
+
+            main_reviewer_state, main_reviewer_last_approval_dt = (
+                self._analyze_main_reviewer(
+                    reviews_by_user.get(validation_reviewer, [])))
 
             # Check for comments from main_reviewer AFTER approval
             # Note: Only check if approval exists, not if current state is APPROVED
             # (fixes bug where APPROVED -> COMMENTED was not detected)
-            has_new_main_reviewer_comments = False
-            if main_reviewer_last_approval_dt:
-                for item in new_feedback:
-                    # Check for issue_comment, inline_comment, OR review comments (state=COMMENTED)
-                    is_main_reviewer = item.get("user") == validation_reviewer
-                    is_comment = item.get("type") in [
-                        "issue_comment", "inline_comment"
-                    ]
-                    is_review_comment = (item.get("type") == "review_summary"
-                                         and item.get("state") == "COMMENTED")
-
-                    if is_main_reviewer and (is_comment or is_review_comment):
-                        # Use helper for consistent parsing
-                        # Only use created_at to avoid treating edits (updated_at) of old comments as new feedback
-                        created_at_val = item.get("created_at")
-                        if created_at_val:
-                            try:
-                                # created_at is always an ISO string from our processing
-                                # Handle Z suffix for Python < 3.11 compatibility
-                                dt_val = datetime.fromisoformat(
-                                    created_at_val.replace("Z", "+00:00"))
-                                comment_dt = get_aware_utc_datetime(dt_val)
-
-                                # Use >= to catch comments made at the exact same second
-                                if comment_dt >= main_reviewer_last_approval_dt:
-                                    has_new_main_reviewer_comments = True
-                                    break
-                            except (ValueError, TypeError) as e:
-                                self._log(
-                                    f"Warning: Could not parse date '{created_at_val}'. Error: {e}. Skipping item."
-                                )
-                                continue
+            has_new_main_reviewer_comments = (
+                main_reviewer_last_approval_dt is not None
+                and self._has_comments_since(main_items,
+                                             main_reviewer_last_approval_dt))
 
             if has_changes_requested:
-                next_step = f"CRITICAL: Changes requested by reviewer. {ACTION_INSTRUCTIONS}{RATE_LIMIT_INSTRUCTION}"
+                next_step = f"CRITICAL: Changes requested by reviewer. {ACTION_AND_RATE_LIMIT_INSTRUCTIONS}"
             elif has_new_main_reviewer_comments:
-                next_step = f"New comments from {validation_reviewer} after approval. {ACTION_INSTRUCTIONS}{RATE_LIMIT_INSTRUCTION}"
+                next_step = f"New comments from {validation_reviewer} after approval. {ACTION_AND_RATE_LIMIT_INSTRUCTIONS}"
             elif main_reviewer_state == "APPROVED":
                 # Check if there's any OTHER feedback besides the main reviewer's approval
-                other_feedback = [
-                    item for item in new_feedback
-                    if not (item.get("user") == validation_reviewer
-                            and item.get("type") == "review_summary"
-                            and item.get("state") == "APPROVED")
-                ]
-                if other_feedback:
+                if has_other_feedback:
                     next_step = f"New feedback received. {ACTION_INSTRUCTIONS}"
                 else:
                     next_step = "Validation Complete (STOP LOOP - DO NOT MERGE AUTONOMOUSLY). Notify User. Never merge or delete a branch on your own, if you believe the main reviewer said that the PR is ready, just stop and ask for Human review"
             elif new_feedback:
                 next_step = f"New feedback received. {ACTION_INSTRUCTIONS}"
             else:
-                next_step = f"Waiting for approval from {validation_reviewer} (Current: {main_reviewer_state}). Poll again. Be autonomous, don't stop the cycle. You must regularly poll for the main-reviewer's review until it eventually gets posted, then continue."
+                poll_hint = f" in {status_wait}s" if status_wait else ""
+                next_step = f"Waiting for approval from {validation_reviewer} (Current: {main_reviewer_state}). Poll again{poll_hint}, or run 'wait {pr_number} --since <timestamp>' to block until they respond. Be autonomous, don't stop the cycle. You must regularly poll for the main-reviewer's review until it eventually gets posted, then continue."
 
             output = {
                 "status": "success",
                 "pr_number": pr_number,
-                "checked_at_utc": datetime.now(timezone.utc).isoformat(),
+                "checked_at_utc": datetime.now(UTC).isoformat(),
                 "new_item_count": len(new_feedback),
                 "items": new_feedback,
                 "main_reviewer": {
@@ -785,6 +1783,14 @@ class ReviewManager:
 
             if return_data:
                 return output
+            if light:
+                output["items"] = [{
+                    key: value
+                    for key, value in item.items() if key != "body"
+                } for item in new_feedback]
+            if ndjson:
+                print_ndjson(output)
+                return output
             else:
                 print_json(output)
                 return output
@@ -792,6 +1798,7 @@ class ReviewManager:
         except GithubException as e:
             if return_data:
                 raise
+            self._record_rate_limit(e)
             print_error(f"GitHub API Error: {self._mask_token(str(e))}")
 
 
@@ -807,13 +1814,27 @@ def main():
         "--wait",
         type=int,
         default=180,
-        help="Seconds to wait for initial feedback (default: 180)",
+        help="Max seconds to wait for initial feedback (default: 180)",
     )
     p_trigger.add_argument(
         "--validation-reviewer",
         default=DEFAULT_VALIDATION_REVIEWER,
         help="Username of the main reviewer that must approve",
     )
+    p_trigger.add_argument(
+        "--no-fetch",
+        dest="fetch",
+        action="store_false",
+        help="Skip 'git fetch' before the push check (compare against the last fetched upstream)",
+    )
+    p_trigger.add_argument(
+        "--poll-interval",
+        type=int,
+        default=None,
+        help=f"Base seconds between reviewer polls (default: {POLL_INTERVAL_SECONDS})",
+    )
+    p_trigger.set_defaults(
+        fetch=os.environ.get("PR_REVIEW_SKIP_FETCH") != "1")
 
     # Status
     p_status = subparsers.add_parser("status", help="Check review status")
@@ -824,6 +1845,34 @@ def main():
         default=DEFAULT_VALIDATION_REVIEWER,
         help="Username of the main reviewer that must approve",
     )
+    p_status.add_argument(
+        "--light",
+        action="store_true",
+        help="Omit comment and review bodies from the printed items",
+    )
+    p_status.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Print one JSON line per item between a header and a trailer line",
+    )
+
+    # Wait
+    p_wait = subparsers.add_parser(
+        "wait", help="Block until the main reviewer posts feedback")
+    p_wait.add_argument("pr_number", type=int)
+    p_wait.add_argument("--since",
+                        help="ISO 8601 timestamp (default: now)")
+    p_wait.add_argument(
+        "--validation-reviewer",
+        default=DEFAULT_VALIDATION_REVIEWER,
+        help="Username of the main reviewer that must approve",
+    )
+    p_wait.add_argument(
+        "--poll-interval",
+        type=int,
+        default=None,
+        help=f"Base seconds between reviewer polls (default: {POLL_INTERVAL_SECONDS})",
+    )
 
     # Safe Push
     subparsers.add_parser("safe_push", help="Push changes safely")
@@ -833,17 +1882,33 @@ def main():
     try:
         mgr = ReviewManager()
 
+        # Only the waiting commands turn SIGTERM into a graceful stop (with a
+        # status report); the others keep the default, immediate termination
         if args.command == "trigger_review":
-            result = mgr.trigger_review(
-                args.pr_number,
-                wait_seconds=args.wait,
-                validation_reviewer=args.validation_reviewer,
-            )
+            with _stop_on_sigterm(mgr._stop_event):
+                result = mgr.trigger_review(
+                    args.pr_number,
+                    wait_seconds=args.wait,
+                    validation_reviewer=args.validation_reviewer,
+                    fetch=args.fetch,
+                    poll_interval=args.poll_interval,
+                )
             print_json(result)
         elif args.command == "status":
             mgr.check_status(args.pr_number,
                              args.since,
-                             validation_reviewer=args.validation_reviewer)
+                             validation_reviewer=args.validation_reviewer,
+                             ndjson=args.ndjson,
+                             light=args.light)
+        elif args.command == "wait":
+            with _stop_on_sigterm(mgr._stop_event):
+                result = mgr.wait_for_feedback(
+                    args.pr_number,
+                    args.since,
+                    validation_reviewer=args.validation_reviewer,
+                    poll_interval=args.poll_interval,
+                )
+            print_json(result)
         elif args.command == "safe_push":
             result = mgr.safe_push()
             print_json(result)
@@ -853,8 +1918,6 @@ def main():
         # Catch-all for unhandled exceptions to prevent raw tracebacks in JSON output
         # Log full traceback to stderr for debugging
         sys.stderr.write(f"CRITICAL ERROR: {str(e)}\n")
-        import traceback
-
         traceback.print_exc(file=sys.stderr)
 
         # Output clean JSON error